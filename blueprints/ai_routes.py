@@ -5,7 +5,11 @@
 #
 # Imports Summary:
 #   - os, requests: fetch environment variables and make HTTP calls
+#   - geohash: coarse location cache keys for summary reuse
+#   - requests.adapters.HTTPAdapter, urllib3.util.retry.Retry: pooled
+#     keep-alive connections with bounded retries for upstream calls
 #   - dotenv.load_dotenv: load .env configurations
+#   - concurrent.futures.ThreadPoolExecutor: overlap the AI call with the DB insert
 #   - flask.Blueprint, request, jsonify, abort: create routes and handle HTTP requests
 #   - cache: caching decorator for responses
 #   - extensions.limiter: rate limiting decorator
@@ -13,7 +17,11 @@
 # ----------------------------------------
 
 import os
+import geohash
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from flask import Blueprint, request, jsonify, abort
 
@@ -45,19 +53,111 @@ CF_HEADERS = {
     "Content-Type": "application/json"
 }
 
+# Fixed part of the Cloudflare payload, built once instead of per request
+_CF_BASE_PAYLOAD = {
+    "parameters": {
+        "max_tokens": 60,
+        "temperature": 0.7,
+        "top_p": 0.9
+    }
+}
+
+# ----------------------------------------
+# Shared HTTP session with connection pooling
+# ----------------------------------------
+# Reusing one session keeps TCP+TLS connections to Geoapify and Cloudflare
+# alive across requests instead of paying a fresh handshake per call; the
+# retry policy covers transient upstream gateway errors
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=64,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+))
+
+# ----------------------------------------
+# Thread pool for in-flight AI calls
+# ----------------------------------------
+# Running the Cloudflare POST on a worker thread lets the Summary database
+# insert proceed while the multi-second inference is still in flight
+_POOL = ThreadPoolExecutor(max_workers=8)
+
+
+def _call_cf(prompt):
+    """
+    POST a prompt to the Cloudflare AI endpoint and return the generated text.
+
+    Runs on the thread pool; raises on any non-2xx response so the caller can
+    surface a model error.
+    """
+
+    # Build the request payload for the ai model from the fixed skeleton
+    payload = {"prompt": prompt, **_CF_BASE_PAYLOAD}
+
+    # Prompt the ai model and raise for any failed response
+    resp = _HTTP.post(CF_ENDPOINT, headers=CF_HEADERS, json=payload, timeout=30)
+    resp.raise_for_status()
+
+    # Return the generated text
+    return resp.json().get("result", {}).get("response", "")
+
+
 # ----------------------------------------
 # Blueprint setup
 # ----------------------------------------
 ai_bp = Blueprint("ai", __name__, url_prefix="/api")
 
+# Geohash precision for summary cache keys; 5 characters is roughly a 5 km
+# cell, so nearby clicks share one cached summary instead of each paying for
+# a fresh Cloudflare call
+GEOHASH_PRECISION = 5
+
+
+def _loc_key():
+    """
+    Build a coarse cache key for the location summary from lat/lng.
+
+    Quantizes the coordinates to a geohash cell so requests anywhere in the
+    same cell hit the same cache entry. Falls back to the raw query string
+    when coordinates are missing or malformed (the view then responds 400).
+    """
+
+    # Gets and determines if lat and long cooridates are usable for a key
+    lat = request.args.get("lat", type=float)
+    lng = request.args.get("lng", type=float)
+    if lat is None or lng is None:
+        # Key on the raw query string so the view can reject it
+        return "loc:invalid:" + request.query_string.decode()
+
+    # Return the quantized location key
+    return "loc:" + geohash.encode(lat, lng, precision=GEOHASH_PRECISION)
+
+
+def _cacheable_response(rv):
+    """
+    Only allow successful view results into the cache.
+
+    A cached error under the coarse geohash key would serve that failure to
+    the whole ~5 km cell for the full TTL; let errors fall through so the
+    next request retries the geocode and AI call.
+    """
+
+    # Reject (body, status) tuples carrying an error status
+    if isinstance(rv, tuple) and len(rv) > 1 and isinstance(rv[1], int):
+        return rv[1] < 400
+
+    # Everything else (plain 200 payloads) is cacheable
+    return True
+
 
 # ----------------------------------------
 # Route: GET /api/location-summary
 # ----------------------------------------
 @ai_bp.route("/location-summary", methods=["GET"])
 @limiter.limit("10/minute")
-# Cache for 24 hours, using lat and lng inputs
-@cache.cached(timeout=86400, query_string=True)
+# Cache for 24 hours, keyed on the geohash cell of the lat/lng inputs;
+# errors are never cached so a failed AI call can't poison the cell
+@cache.cached(timeout=86400, make_cache_key=_loc_key, response_filter=_cacheable_response)
 def location_summary():
     """
     Reverse-geocode a given lat/lng, prompt AI to generate a summary, and store it.
@@ -78,7 +178,7 @@ def location_summary():
 
     # Reverse-geocode via Geoapify and check if response is valid
     params = {"lat": lat, "lon": lng, "apiKey": GEO_TOKEN}
-    geo_resp = requests.get(GEO_API, params=params, timeout=5)
+    geo_resp = _HTTP.get(GEO_API, params=params, timeout=5)
     if geo_resp.status_code != 200:
         # Abort if not valid
         abort(502, f"Geoapify error: {geo_resp.text}")
@@ -89,55 +189,48 @@ def location_summary():
         # Abort if not valid
         abort(404, "No location data found")
 
-    # Create and store properties of location
+    # Create a comma sperated description from the location properties,
+    # deduplicated in order via dict.fromkeys (state can equal country)
     props = features[0]["properties"]
-    place_parts = []
-    for key in ("state","country"):
-
-        # Check for redundant descriptions
-        v = props.get(key)
-        if v and v not in place_parts:
-            place_parts.append(v)
-    
-    # Create a comma sperated string from the description
-    description = ", ".join(place_parts)
+    description = ", ".join(
+        dict.fromkeys(v for v in (props.get("state"), props.get("country")) if v)
+    )
 
     # Create ai mmodel prompt
     prompt = f"Give me an description of the area {description} within {RESPONSE_LENGTH} words, without stopping in the middle of a sentence".strip()
 
-    # Attempt to prompt ai model
-    try:
-        payload = {
-            "prompt": prompt,
-            "parameters": {
-                "max_tokens": 60,
-                "temperature": 0.7,
-                "top_p": 0.9
-            }
-        }
-        resp = requests.post(CF_ENDPOINT, headers=CF_HEADERS, json=payload, timeout=30)
-        resp.raise_for_status()
-        generated = resp.json().get("result", {}).get("response", "") 
-    except Exception as e:
-        # Throw error if model is unable to respond
-        return jsonify({
-            "error": "Model response error",
-            "details": repr(e)
-        }), 502
+    # Kick the ai model prompt off on the thread pool so the database insert
+    # below overlaps the inference instead of waiting behind it
+    ai_future = _POOL.submit(_call_cf, prompt)
 
-    # Attempt to save location summary
+    # Attempt to save a location summary skeleton while the AI call is in flight
     try:
-        # Create new summary object in database
+        # Create new summary object in database (summary text filled in below)
         summary = Summary(
-            location=description, 
-            summary=generated, 
-            lat=float(lat), 
+            location=description,
+            summary="",
+            lat=float(lat),
             lng=float(lng))
         db.session.add(summary)
-        db.session.commit()
+        db.session.flush()
     except Exception as e:
         # Abort if saving failed
         abort(500,"Failed to save location summary")
+
+    # Attempt to collect the ai model response
+    try:
+        generated = ai_future.result()
+    except Exception as e:
+        # Throw error if model is unable to respond, discarding the skeleton
+        db.session.rollback()
+        return jsonify({
+            "error": "Model response error",
+            "details": repr(e)
+        }), 502
+
+    # Fill in the generated text and commit the completed summary
+    summary.summary = generated
+    db.session.commit()
         
     # Return JSON of id, lat, long, description, summary, and posted at values
     return jsonify({
@@ -3,12 +3,15 @@
 #   - Define and configure shared Flask extensions (rate limiter, CSRF, caching)
 #
 # Imports Summary:
+#   - os: read rate-limit storage configuration from the environment
 #   - flask_limiter.Limiter: rate-limiting support
 #   - flask_limiter.util.get_remote_address: key function for identifying clients
 #   - flask_wtf.CSRFProtect: CSRF protection
 #   - flask_caching.Cache: caching support
 # ----------------------------------------
 
+import os
+
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_wtf import CSRFProtect
@@ -17,7 +20,14 @@ from flask_caching import Cache
 # ----------------------------------------
 # Rate limiter: uses client IP as key
 # ----------------------------------------
-limiter = Limiter(key_func=get_remote_address)
+# Counters live in Redis when a URL is configured so limits hold across
+# gunicorn workers (the in-memory default is per-process); the fixed-window
+# strategy keeps per-check storage traffic to a single counter touch
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=os.getenv("RATELIMIT_STORAGE_URI") or os.getenv("REDIS_URL") or "memory://",
+    strategy="fixed-window",
+)
 
 # ----------------------------------------
 # CSRF protection middleware for form submissions
@@ -4,12 +4,9 @@
 #   - Each model can serialize itself to a JSON-friendly dict
 #
 # Imports Summary:
-#   - datetime, timezone: for timestamp defaults and conversion
 #   - db (from db.py): SQLAlchemy instance for model definitions
 # ----------------------------------------
 
-from datetime import datetime, timezone
-
 # Local imports
 from db import db
 
@@ -24,25 +21,30 @@ class Message(db.Model):
     lat = db.Column(db.Float, nullable=False)
     lng = db.Column(db.Float, nullable=False)
     posted_at = db.Column(
-        db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        db.DateTime(timezone=True), default=db.func.now()
+    )
+
+    # Composite index matching the filter_messages access pattern: range scan
+    # on posted_at (newest first, no sort step) with lat/lng available for the
+    # bounding-box filter. Its leading column also serves the TTL purge scan.
+    __table_args__ = (
+        db.Index('ix_message_posted_lat_lng', posted_at.desc(), lat, lng),
     )
 
     def to_dict(self):
         """
         Serialize a Message instance to a JSON-compatible dictionary.
 
-        - Ensures 'posted_at' is UTC-aware and formatted as ISO string.
+        - 'posted_at' is always stored as UTC, so it is formatted directly.
         """
 
-        # Check if there is a timezone and update time to use it else use utc
+        # Formate datetime as 'YYYY-MM-DDTHH:MM:SSZ'; the value is always UTC
+        # so no tzinfo branch or strftime (with its locale machinery) needed
         dt = self.posted_at
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
-
-        # Formate datetime as 'YYYY-MM-DDTHH:MM:SSZ'
-        formateDatetime = dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+        formateDatetime = (
+            f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d}'
+            f'T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z'
+        )
 
         # Return serialized message
         return {
@@ -65,25 +67,23 @@ class Summary(db.Model):
     lat = db.Column(db.Float, nullable=False)
     lng = db.Column(db.Float, nullable=False)
     posted_at = db.Column(
-        db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        db.DateTime(timezone=True), default=db.func.now()
     )
-    
+
     def to_dict(self):
         """
         Serialize a Summary instance to a JSON-compatible dictionary.
 
-        - Ensures 'posted_at' is UTC-aware and formatted as ISO string.
+        - 'posted_at' is always stored as UTC, so it is formatted directly.
         """
-        
-        # Check if there is a timezone and update time to use it else use utc
-        dt = self.posted_at
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        else:
-            dt = dt.astimezone(timezone.utc)
 
-        # Formate datetime as 'YYYY-MM-DDTHH:MM:SSZ'
-        formateDatetime = dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+        # Formate datetime as 'YYYY-MM-DDTHH:MM:SSZ'; the value is always UTC
+        # so no tzinfo branch or strftime (with its locale machinery) needed
+        dt = self.posted_at
+        formateDatetime = (
+            f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d}'
+            f'T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z'
+        )
 
         # Return serialized summary
         return {